@@ -13,27 +13,21 @@ Important: Question/answer verbiage shown is stored verbatim from the source doc
 from __future__ import annotations
 
 import argparse
-import random
-import re
-import sqlite3
-from dataclasses import dataclass
+import sys
 from pathlib import Path
-from typing import Optional
 from os import system,name
 
 
 from colorama import Fore, Style, init as colorama_init
 
-colorama_init(autoreset=True)
+# QA, grading, and DB loading live in the shared core next to the GUI
+# sources; reuse them instead of keeping parallel (and weaker) copies here
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "GUI" / "src"))
+
+from quiz_core import is_correct, load_random_questions  # noqa: E402
 
+colorama_init(autoreset=True)
 
-@dataclass
-class QA:
-    qnum: int
-    question_text: str
-    answer_text: str
-    answer_value: Optional[str]
-    answer_option: Optional[str]
 
 def clear():
     if name == "nt":
@@ -41,77 +35,6 @@ def clear():
     else: 
         _ = system("clear")
         
-def normalize(s: str) -> str:
-    # grading normalization only; does not modify stored data
-    return re.sub(r"\s+", " ", s.strip()).lower()
-
-
-def load_random_questions(db_path: Path, count: int, seed: Optional[int]) -> list[QA]:
-    rng = random.Random(seed)
-
-    with sqlite3.connect(str(db_path)) as conn:
-        conn.row_factory = sqlite3.Row
-        total = conn.execute("SELECT COUNT(*) AS c FROM questions").fetchone()["c"]
-        if total == 0:
-            raise SystemExit("Database contains 0 questions.")
-
-        if count > total:
-            raise SystemExit(f"Requested {count} questions, but database only has {total}.")
-
-        # sample qnums to avoid expensive ORDER BY RANDOM() for larger dbs
-        qnums = [r["qnum"] for r in conn.execute("SELECT qnum FROM questions").fetchall()]
-        chosen = rng.sample(qnums, count)
-
-        rows = conn.execute(
-            f"""
-            SELECT qnum, question_text, answer_text, answer_value, answer_option
-            FROM questions
-            WHERE qnum IN ({",".join("?" for _ in chosen)})
-            """,
-            chosen,
-        ).fetchall()
-
-        # preserve randomized order
-        by_qnum = {r["qnum"]: r for r in rows}
-        ordered = [by_qnum[n] for n in chosen]
-
-        return [
-            QA(
-                qnum=r["qnum"],
-                question_text=r["question_text"],
-                answer_text=r["answer_text"],
-                answer_value=r["answer_value"],
-                answer_option=r["answer_option"],
-            )
-            for r in ordered
-        ]
-
-
-def is_correct(user_answer: str, qa: QA, case_sensitive: bool) -> bool:
-    ua = user_answer.strip()
-    if not ua:
-        return False
-
-    # Accept option letter (e.g., "C") when provided
-    if qa.answer_option:
-        if (ua.strip().upper() == qa.answer_option.upper()):
-            return True
-
-    # Accept the derived answer value
-    if qa.answer_value:
-        if case_sensitive:
-            if ua.strip() == qa.answer_value.strip():
-                return True
-        else:
-            if normalize(ua) == normalize(qa.answer_value):
-                return True
-
-    # Fallback: allow matching within the raw answer text (verbatim) for edge cases
-    if case_sensitive:
-        return ua in qa.answer_text
-    return normalize(ua) in normalize(qa.answer_text)
-
-
 def main() -> int:
     ap = argparse.ArgumentParser()
     ap.add_argument("--db", required=True, type=Path, help="SQLite database file")
@@ -124,52 +47,78 @@ def main() -> int:
     if not args.db.exists():
         raise SystemExit(f"DB not found: {args.db}")
 
-    qas = load_random_questions(args.db, args.count, args.seed)
+    # bind the loop's color codes and rule strings to locals once; inside the
+    # per-question loop these are LOAD_FASTs instead of module-attribute walks
+    GREEN, RED, RST = Fore.GREEN, Fore.RED, Style.RESET_ALL
+    HEADER = "=" * 80
+    SEP = "-" * 80
+
+    try:
+        qas = load_random_questions(args.db, args.count, args.seed)
+    except ValueError as e:
+        raise SystemExit(str(e))
 
     results = []  # list of (QA, user_answer, correct_bool)
 
-    print(f"Loaded {len(qas)} questions. Type your answer and press Enter.\n")
+    out = sys.stdout
+    out.write(f"Loaded {len(qas)} questions. Type your answer and press Enter.\n\n")
 
+    # emit each question header/feedback as one pre-assembled write: stdout is
+    # line-buffered on a tty, so per-print flushes become one flush per block
     for idx, qa in enumerate(qas, start=1):
-        print("=" * 80)
-        print(f"Question {idx}/{len(qas)} (Source question #{qa.qnum})")
-        print()
-        print(qa.question_text)
-        print()
-        ua = input("Your answer> ")
+        out.write(
+            "\n".join(
+                (
+                    HEADER,
+                    f"Question {idx}/{len(qas)} (Source question #{qa.qnum})",
+                    "",
+                    qa.question_text,
+                    "",
+                    "Your answer> ",
+                )
+            )
+        )
+        out.flush()
+        ua = sys.stdin.readline().rstrip("\n")
         correct = is_correct(ua, qa, args.case_sensitive)
         results.append((qa, ua, correct))
 
+        feedback = []
         if args.show_answer or not correct:
-            print()
-            print(f"{Fore.GREEN}[+] Answer>{Style.RESET_ALL}")
-            print(f"{Fore.GREEN}{qa.answer_text}{Style.RESET_ALL}")
-
-        print(f"\n{Fore.GREEN if correct else Fore.RED}Result: {'CORRECT' if correct else 'INCORRECT'}{Style.RESET_ALL}\n")
+            feedback.append(f"\n{GREEN}[+] Answer>{RST}\n{GREEN}{qa.answer_text}{RST}\n")
+        feedback.append(f"\n{GREEN if correct else RED}Result: {'CORRECT' if correct else 'INCORRECT'}{RST}\n\n")
+        out.write("".join(feedback))
 
-    correct_count = sum(1 for _, _, c in results if c)
+    correct_count = sum(c for _, _, c in results)
     total = len(results)
     pct = (correct_count / total) * 100 if total else 0.0
 
     missed = [(qa, ua) for qa, ua, c in results if not c]
 
-    input("Press any key to continue to summary...")
+    out.write("Press any key to continue to summary...")
+    out.flush()
+    sys.stdin.readline()
     clear()
-    
-    print("=" * 80)
-    print("Round Summary")
-    print(f"Correct: {correct_count}/{total}")
-    print(f"Score: {pct:.2f}%")
+
+    summary = [
+        HEADER,
+        "Round Summary",
+        f"Correct: {correct_count}/{total}",
+        f"Score: {pct:.2f}%",
+    ]
 
     if missed:
-        print("\nMissed Questions:")
+        summary.append("\nMissed Questions:")
         for qa, ua in missed:
-            print("-" * 80)
-            print(f"Source question #{qa.qnum}")
-            print(qa.question_text)
-            print(f"{Fore.RED}\nYour answer: {ua!r}{Style.RESET_ALL}")
-            print(f"{Fore.GREEN}[+] Answer>{Style.RESET_ALL}")
-            print(f"{Fore.GREEN}{qa.answer_text}{Style.RESET_ALL}")
+            summary.append(SEP)
+            summary.append(f"Source question #{qa.qnum}")
+            summary.append(qa.question_text)
+            summary.append(f"{RED}\nYour answer: {ua!r}{RST}")
+            summary.append(f"{GREEN}[+] Answer>{RST}")
+            summary.append(f"{GREEN}{qa.answer_text}{RST}")
+
+    summary.append("")
+    out.write("\n".join(summary))
 
     return 0
 
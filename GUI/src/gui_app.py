@@ -1,17 +1,17 @@
 from __future__ import annotations
 
 import random
+import re
 import sys
 from pathlib import Path
 from typing import Optional
 
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import QObject, QRunnable, Qt, QThreadPool, QTimer, Signal
 from PySide6.QtGui import QFont, QKeySequence, QShortcut
 from PySide6.QtWidgets import (
     QApplication,
     QButtonGroup,
     QCheckBox,
-    QFileDialog,
     QFormLayout,
     QGroupBox,
     QHBoxLayout,
@@ -32,31 +32,68 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
-from quiz_core import QA, extract_mc_options, is_correct, load_random_questions
+from quiz_core import QA, is_correct, load_random_questions
+
+
+# single-pass escape table; str.translate walks the string once in C
+_HTML_ESCAPE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+
+# shared font/style singletons: QFont construction triggers a font-database
+# lookup and inline stylesheet strings are re-parsed by Qt's CSS engine, so
+# resolve each of these once at import
+_TITLE_FONT = QFont("Segoe UI", 16, QFont.Weight.Bold)
+_HEADER_FONT = QFont("Segoe UI", 11, QFont.Weight.DemiBold)
+_SUMMARY_FONT = QFont("Segoe UI", 14, QFont.Weight.Bold)
+_BODY_FONT = QFont("Segoe UI", 12)
+_HINT_CSS = "color: #666;"
 
 
 def escape_html(s: str) -> str:
-    return (s or "").replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+    return (s or "").translate(_HTML_ESCAPE)
+
+
+# one compiled pass over the question text instead of eight substring scans
+# (plus a .lower() copy) per call
+_MULTI_RE = re.compile(r"(?:pick|choose|select)\s+(?:two|2|all that apply)", re.IGNORECASE)
+_REV_ALPHA_RE = re.compile(r"reverse\s+alphabetical", re.IGNORECASE)
+_ALPHA_ORDER_RE = re.compile(r"alphabetical\s+order", re.IGNORECASE)
 
 
 def is_multi_select_question(question_text: str) -> bool:
-    t = (question_text or "").lower()
-    return (
-        "pick two" in t
-        or "pick 2" in t
-        or "choose two" in t
-        or "choose 2" in t
-        or "select two" in t
-        or "select 2" in t
-        or "select all that apply" in t
-        or "choose all that apply" in t
-    )
+    return bool(_MULTI_RE.search(question_text or ""))
 
 
 def _split_csv_list(s: str) -> list[str]:
     return [p.strip() for p in (s or "").split(",") if p.strip()]
 
 
+# sort keys for multi-select submissions, hoisted so set_question can pick one
+# per question without allocating a closure
+def _opt_sort_by_text(t: tuple[str, str]) -> str:
+    return t[1].lower()
+
+
+def _opt_sort_by_letter(t: tuple[str, str]) -> str:
+    return t[0].upper()
+
+
+# static details-pane skeleton; filled with C-level %-formatting per selection
+# instead of re-assembling the document in Python
+_DETAILS_TPL = """
+<div>
+  <div style="margin-bottom:8px;"><b>Source question #%(qnum)s</b> — %(status)s%(flag)s</div>
+  <pre style="white-space:pre-wrap; font-family:Segoe UI, Consolas, monospace;">%(qtxt)s</pre>
+  <div style="margin-top:10px;">
+    <b>Your answer:</b> <span style="color:%(your_color)s; font-weight:600;">%(ua)s</span>
+  </div>
+  <div style="margin-top:8px;">
+    <b>Answer:</b><br>
+    <span style="color:#0a7a0a; font-weight:600;">%(ans)s</span>
+  </div>
+</div>
+"""
+
+
 class StartPage(QWidget):
     def __init__(self, on_start, on_pick_db):
         super().__init__()
@@ -66,7 +103,7 @@ class StartPage(QWidget):
         layout = QVBoxLayout(self)
 
         title = QLabel("CNAB Study Quiz")
-        title.setFont(QFont("Segoe UI", 16, QFont.Weight.Bold))
+        title.setFont(_TITLE_FONT)
         layout.addWidget(title)
 
         form = QFormLayout()
@@ -168,7 +205,7 @@ class QuizPage(QWidget):
         layout = QVBoxLayout(left)
 
         self.progress = QLabel("Question 0/0")
-        self.progress.setFont(QFont("Segoe UI", 11, QFont.Weight.DemiBold))
+        self.progress.setFont(_HEADER_FONT)
         layout.addWidget(self.progress)
 
         self.progress_bar = QProgressBar()
@@ -182,6 +219,12 @@ class QuizPage(QWidget):
         layout.addWidget(self.q_text, 1)
 
         self.answer_box = QGroupBox("Your Answer")
+        # one stylesheet on the box, driven by a per-widget "state" property;
+        # highlighting then never re-parses CSS per option widget
+        self.answer_box.setStyleSheet(
+            'QAbstractButton[state="correct"] { color: #0a7a0a; font-weight: 600; }'
+            ' QAbstractButton[state="wrong"] { color: #b00020; font-weight: 600; }'
+        )
         self.answer_layout = QVBoxLayout(self.answer_box)
         layout.addWidget(self.answer_box)
 
@@ -210,14 +253,14 @@ class QuizPage(QWidget):
         rlayout = QVBoxLayout(right)
 
         hdr = QLabel("This Round")
-        hdr.setFont(QFont("Segoe UI", 11, QFont.Weight.DemiBold))
+        hdr.setFont(_HEADER_FONT)
         rlayout.addWidget(hdr)
 
         self.round_list = QListWidget()
         rlayout.addWidget(self.round_list, 1)
 
         hint = QLabel("Per-question results (green=correct, red=incorrect).")
-        hint.setStyleSheet("color: #666;")
+        hint.setStyleSheet(_HINT_CSS)
         rlayout.addWidget(hint)
 
         splitter.addWidget(right)
@@ -227,27 +270,70 @@ class QuizPage(QWidget):
 
         # input state
         self._mode = "text"
-        self._mc_group: Optional[QButtonGroup] = None
+        self._current_qa: Optional[QA] = None
+        # per-round display order for MC options, precomputed by MainWindow
+        self._display_options: Optional[dict[int, list[tuple[str, str]]]] = None
+        # per-question constants, computed once in set_question
+        self._expected_norm: frozenset[str] = frozenset()
+        self._multi_sort: tuple = (_opt_sort_by_letter, False)
+
+        # Widget pool: option widgets are constructed (and their signals
+        # connected) once, then re-labeled and shown/hidden per question.
+        # Avoids per-question Qt construction/destruction on the GUI thread.
+        self._mc_group = QButtonGroup(self)
+        self._mc_group.setExclusive(True)
+        self._rb_pool: list[QRadioButton] = []
+        self._cb_pool: list[QCheckBox] = []
+        for _ in range(9):
+            self._grow_rb_pool()
+            self._grow_cb_pool()
+
+        self._text_input = QLineEdit()
+        self._text_input.setPlaceholderText("Type your answer…")
+        self._text_input.textChanged.connect(self._update_submit_enabled)
+        self._text_input.returnPressed.connect(self._submit_clicked)
+        self._text_input.setVisible(False)
+        self.answer_layout.addWidget(self._text_input)
+
+        self._answer_hint = QLabel("")
+        self._answer_hint.setStyleSheet(_HINT_CSS)
+        self.answer_layout.addWidget(self._answer_hint)
+
+        # visible slices of the pools for the current question, plus parallel
+        # Python-side letter/text lists (list indexing beats QObject.property's
+        # QVariant round-trip on the submit/highlight path)
         self._mc_buttons: list[QRadioButton] = []
         self._mc_checks: list[QCheckBox] = []
-        self._text_input: Optional[QLineEdit] = None
-        self._current_qa: Optional[QA] = None
-        self._shuffle_options = False
-        self._round_seed: Optional[int] = None
+        self._mc_letters: list[str] = []
+        self._mc_texts: list[str] = []
 
-        # Keyboard shortcuts
-        QShortcut(QKeySequence(Qt.Key.Key_Return), self, activated=self._submit_clicked)
-        QShortcut(QKeySequence(Qt.Key.Key_Enter), self, activated=self._submit_clicked)
+        # Keyboard shortcuts. Only Ctrl+F keeps a QShortcut (modifier handling
+        # is cleaner there); Return/Enter and 1-9 are dispatched in
+        # keyPressEvent below instead of eleven shortcut-map registrations
+        # with a closure each.
         QShortcut(QKeySequence("Ctrl+F"), self, activated=self._toggle_flag)
-        for i in range(1, 10):
-            QShortcut(QKeySequence(str(i)), self, activated=lambda i=i: self._select_option_by_index(i - 1))
 
         # initial submit disabled
         self.submit_btn.setEnabled(False)
 
-    def set_round_config(self, *, shuffle_options: bool, seed: Optional[int]):
-        self._shuffle_options = bool(shuffle_options)
-        self._round_seed = seed
+    def _grow_rb_pool(self):
+        rb = QRadioButton()
+        rb.toggled.connect(self._update_submit_enabled)
+        rb.setVisible(False)
+        self._mc_group.addButton(rb)
+        # keep radios contiguous at the top of the layout
+        self.answer_layout.insertWidget(len(self._rb_pool), rb)
+        self._rb_pool.append(rb)
+
+    def _grow_cb_pool(self):
+        cb = QCheckBox()
+        cb.toggled.connect(self._update_submit_enabled)
+        cb.setVisible(False)
+        self.answer_layout.insertWidget(len(self._rb_pool) + len(self._cb_pool), cb)
+        self._cb_pool.append(cb)
+
+    def set_round_config(self, *, display_options: Optional[dict[int, list[tuple[str, str]]]] = None):
+        self._display_options = display_options
 
     def reset_round(self):
         self.round_list.clear()
@@ -256,8 +342,16 @@ class QuizPage(QWidget):
         label = f"Question {q_index}: " + ("Correct" if correct else "Incorrect")
         item = QListWidgetItem(label)
         item.setForeground(Qt.GlobalColor.darkGreen if correct else Qt.GlobalColor.red)
+
+        # only follow the tail if the user hasn't scrolled away; an
+        # unconditional scrollToBottom forces a relayout on every add
+        bar = self.round_list.verticalScrollBar()
+        follow = bar.value() == bar.maximum()
+        self.round_list.setUpdatesEnabled(False)
         self.round_list.addItem(item)
-        self.round_list.scrollToBottom()
+        if follow:
+            self.round_list.scrollToBottom()
+        self.round_list.setUpdatesEnabled(True)  # one coalesced repaint
 
     def is_flagged(self) -> bool:
         return bool(self.flag_box.isChecked())
@@ -275,21 +369,49 @@ class QuizPage(QWidget):
 
         self._current_qa = qa
 
-        # clear answer layout
-        while self.answer_layout.count():
-            item = self.answer_layout.takeAt(0)
-            w = item.widget()
-            if w:
-                w.deleteLater()
+        # per-question constants for submit/highlight, computed once here
+        # instead of on every highlight pass
+        av = (qa.answer_value or "").strip()
+        if "," in av:
+            self._expected_norm = frozenset(p.lower() for p in _split_csv_list(av))
+        elif av:
+            self._expected_norm = frozenset((av.lower(),))
+        else:
+            self._expected_norm = frozenset()
+
+        qtxt = qa.question_text or ""
+        if _REV_ALPHA_RE.search(qtxt):
+            self._multi_sort = (_opt_sort_by_text, True)
+        elif _ALPHA_ORDER_RE.search(qtxt):
+            self._multi_sort = (_opt_sort_by_text, False)
+        else:
+            self._multi_sort = (_opt_sort_by_letter, False)
+
+        # reset pooled widgets (exclusive groups refuse to uncheck, so lift
+        # exclusivity for the radio sweep)
+        self._mc_group.setExclusive(False)
+        for rb in self._rb_pool:
+            rb.setChecked(False)
+            self._set_option_state(rb, "")
+            rb.setEnabled(True)
+            rb.setVisible(False)
+        self._mc_group.setExclusive(True)
+        for cb in self._cb_pool:
+            cb.setChecked(False)
+            self._set_option_state(cb, "")
+            cb.setEnabled(True)
+            cb.setVisible(False)
+        self._text_input.clear()
+        self._text_input.setEnabled(True)
+        self._text_input.setVisible(False)
 
-        # clear input refs
         self._mode = "text"
-        self._mc_group = None
         self._mc_buttons = []
         self._mc_checks = []
-        self._text_input = None
+        self._mc_letters = []
+        self._mc_texts = []
 
-        options = extract_mc_options(qa.question_text)
+        options = qa.mc_options
 
         # disable submit until valid
         self.submit_btn.setEnabled(False)
@@ -298,56 +420,46 @@ class QuizPage(QWidget):
             multi = is_multi_select_question(qa.question_text)
             self._mode = "mc_multi" if multi else "mc"
 
-            # deterministic shuffle per round/question, so shortcuts map consistently per question
-            opts = list(options)
-            if self._shuffle_options:
-                base = (self._round_seed or 0)
-                rng = random.Random((base * 1_000_003) + int(qa.qnum))
-                rng.shuffle(opts)
+            # display order was fixed once at round start; a dict lookup here
+            # keeps the per-question render path free of shuffle work
+            opts = self._display_options.get(qa.qnum, options) if self._display_options else options
+
+            pool = self._cb_pool if multi else self._rb_pool
+            grow = self._grow_cb_pool if multi else self._grow_rb_pool
+            while len(pool) < len(opts):
+                grow()
+
+            for w, (letter, text) in zip(pool, opts):
+                w.setText(f"{letter} - {text}")
+                w.setVisible(True)
+                self._mc_letters.append(letter)
+                self._mc_texts.append(text)
 
             if multi:
-                for letter, text in opts:
-                    cb = QCheckBox(f"{letter} - {text}")
-                    cb.setProperty("letter", letter)
-                    cb.setProperty("opt_text", text)
-                    cb.toggled.connect(self._update_submit_enabled)
-                    self._mc_checks.append(cb)
-                    self.answer_layout.addWidget(cb)
-
-                hint = QLabel("Select all applicable options, then click Submit.")
-                hint.setStyleSheet("color: #666;")
-                self.answer_layout.addWidget(hint)
+                self._mc_checks = self._cb_pool[: len(opts)]
+                self._answer_hint.setText("Select all applicable options, then click Submit.")
             else:
-                self._mc_group = QButtonGroup(self)
-                self._mc_group.setExclusive(True)
-
-                for letter, text in opts:
-                    rb = QRadioButton(f"{letter} - {text}")
-                    rb.setProperty("letter", letter)
-                    rb.setProperty("opt_text", text)
-                    rb.toggled.connect(self._update_submit_enabled)
-                    self._mc_group.addButton(rb)
-                    self._mc_buttons.append(rb)
-                    self.answer_layout.addWidget(rb)
-
-                hint = QLabel("Select one option, then click Submit.")
-                hint.setStyleSheet("color: #666;")
-                self.answer_layout.addWidget(hint)
-
-            self._update_submit_enabled()
+                self._mc_buttons = self._rb_pool[: len(opts)]
+                self._answer_hint.setText("Select one option, then click Submit.")
         else:
-            self._mode = "text"
-            self._text_input = QLineEdit()
-            self._text_input.setPlaceholderText("Type your answer…")
-            self._text_input.textChanged.connect(self._update_submit_enabled)
-            self._text_input.returnPressed.connect(self._submit_clicked)
-            self.answer_layout.addWidget(self._text_input)
+            self._text_input.setVisible(True)
+            self._answer_hint.setText(
+                "Fill-in questions are graded against the stored answer (case handling is a setting)."
+            )
 
-            hint = QLabel("Fill-in questions are graded against the stored answer (case handling is a setting).")
-            hint.setStyleSheet("color: #666;")
-            self.answer_layout.addWidget(hint)
+        self._update_submit_enabled()
 
-            self._update_submit_enabled()
+    def keyPressEvent(self, ev):
+        k = ev.key()
+        if Qt.Key.Key_1 <= k <= Qt.Key.Key_9:
+            self._select_option_by_index(k - Qt.Key.Key_1)
+            ev.accept()
+            return
+        if k in (Qt.Key.Key_Return, Qt.Key.Key_Enter):
+            self._submit_clicked()
+            ev.accept()
+            return
+        super().keyPressEvent(ev)
 
     def _select_option_by_index(self, idx0: int):
         # 1–9 shortcut: select by display index for current question
@@ -368,17 +480,6 @@ class QuizPage(QWidget):
             enabled = bool(self._text_input and self._text_input.text().strip())
         self.submit_btn.setEnabled(enabled)
 
-    def _expected_mc_texts(self) -> set[str]:
-        """Return expected option text values for the current question when possible."""
-        qa = self._current_qa
-        if not qa:
-            return set()
-        if qa.answer_value and "," in qa.answer_value:
-            return set(_split_csv_list(qa.answer_value))
-        if qa.answer_value and qa.answer_value.strip():
-            return {qa.answer_value.strip()}
-        return set()
-
     def get_user_answer(self) -> str:
         # Single-select multiple choice
         if self._mode == "mc" and self._mc_group:
@@ -386,34 +487,25 @@ class QuizPage(QWidget):
             if not btn:
                 return ""
 
+            i = self._mc_buttons.index(btn)
             qa = self._current_qa
             if qa and qa.answer_option:
-                return str(btn.property("letter") or "").strip()
+                return self._mc_letters[i]
 
-            return str(btn.property("opt_text") or "").strip()
+            return self._mc_texts[i]
 
         # Multi-select multiple choice (submit option text list)
         if self._mode == "mc_multi":
             picked = [
-                (
-                    str(cb.property("letter") or "").strip(),
-                    str(cb.property("opt_text") or "").strip(),
-                )
-                for cb in self._mc_checks
+                (self._mc_letters[i], self._mc_texts[i])
+                for i, cb in enumerate(self._mc_checks)
                 if cb.isChecked()
             ]
             if not picked:
                 return ""
 
-            qtxt = (self._current_qa.question_text if self._current_qa else "") or ""
-            qlow = qtxt.lower()
-
-            if "reverse alphabetical" in qlow:
-                picked.sort(key=lambda t: t[1].lower(), reverse=True)
-            elif "alphabetical order" in qlow:
-                picked.sort(key=lambda t: t[1].lower())
-            else:
-                picked.sort(key=lambda t: t[0].upper())
+            sort_key, reverse = self._multi_sort
+            picked.sort(key=sort_key, reverse=reverse)
 
             return ", ".join(text for _letter, text in picked)
 
@@ -430,11 +522,19 @@ class QuizPage(QWidget):
         if self._text_input:
             self._text_input.setEnabled(enabled)
 
+    @staticmethod
+    def _set_option_state(w, state: str):
+        # only repolish widgets whose state actually changed
+        if w.property("state") != state:
+            w.setProperty("state", state)
+            w.style().unpolish(w)
+            w.style().polish(w)
+
     def _clear_option_styles(self):
         for rb in self._mc_buttons:
-            rb.setStyleSheet("")
+            self._set_option_state(rb, "")
         for cb in self._mc_checks:
-            cb.setStyleSheet("")
+            self._set_option_state(cb, "")
 
     def highlight_answers(self, correct: bool):
         """Highlight correct choice(s) and user's incorrect selection(s)."""
@@ -445,14 +545,12 @@ class QuizPage(QWidget):
 
         # Multi-select highlighting
         if self._mode == "mc_multi":
-            expected = self._expected_mc_texts()
-            expected_norm = {e.strip().lower() for e in expected}
-            for cb in self._mc_checks:
-                t = str(cb.property("opt_text") or "").strip()
-                if t.strip().lower() in expected_norm:
-                    cb.setStyleSheet("color: #0a7a0a; font-weight: 600;")
+            expected_norm = self._expected_norm
+            for i, cb in enumerate(self._mc_checks):
+                if self._mc_texts[i].lower() in expected_norm:
+                    self._set_option_state(cb, "correct")
                 elif cb.isChecked():
-                    cb.setStyleSheet("color: #b00020; font-weight: 600;")
+                    self._set_option_state(cb, "wrong")
             return
 
         # Single-select multiple choice highlighting
@@ -460,22 +558,20 @@ class QuizPage(QWidget):
             selected = self._mc_group.checkedButton()
             if qa.answer_option:
                 expected_letter = qa.answer_option.strip().upper()
-                for rb in self._mc_buttons:
-                    if str(rb.property("letter") or "").strip().upper() == expected_letter:
-                        rb.setStyleSheet("color: #0a7a0a; font-weight: 600;")
+                for i, rb in enumerate(self._mc_buttons):
+                    if self._mc_letters[i] == expected_letter:
+                        self._set_option_state(rb, "correct")
                 if selected and not correct:
-                    selected.setStyleSheet("color: #b00020; font-weight: 600;")
+                    self._set_option_state(selected, "wrong")
                 return
 
             # answer_option missing -> match by answer_value against option text
-            expected = self._expected_mc_texts()
-            expected_norm = {e.strip().lower() for e in expected}
-            for rb in self._mc_buttons:
-                t = str(rb.property("opt_text") or "").strip()
-                if t.strip().lower() in expected_norm:
-                    rb.setStyleSheet("color: #0a7a0a; font-weight: 600;")
+            expected_norm = self._expected_norm
+            for i, rb in enumerate(self._mc_buttons):
+                if self._mc_texts[i].lower() in expected_norm:
+                    self._set_option_state(rb, "correct")
             if selected and not correct:
-                selected.setStyleSheet("color: #b00020; font-weight: 600;")
+                self._set_option_state(selected, "wrong")
             return
 
     def set_feedback(self, correct: bool, answer_text: str, show_answer: bool):
@@ -507,7 +603,7 @@ class ResultsPage(QWidget):
         layout = QVBoxLayout(self)
 
         title = QLabel("Round Summary")
-        title.setFont(QFont("Segoe UI", 14, QFont.Weight.Bold))
+        title.setFont(_SUMMARY_FONT)
         layout.addWidget(title)
 
         self.summary = QLabel("")
@@ -541,46 +637,53 @@ class ResultsPage(QWidget):
         layout.addLayout(btn_row)
 
         self.q_list.currentItemChanged.connect(self._on_selected)
-        self._payload: list[dict] = []
+        # round results as (QA, user_answer, correct, flagged) tuples; the
+        # details view is rendered lazily for the selected row only
+        self._results: list[tuple[QA, str, bool, bool]] = []
 
-    def set_results(self, correct_count: int, total: int, payload: list[dict]):
+    def set_results(self, correct_count: int, total: int, results: list[tuple[QA, str, bool, bool]]):
         pct = (correct_count / total) * 100 if total else 0.0
         self.summary.setText(
             f"<b>Correct:</b> {correct_count}/{total}<br>"
             f"<b>Score:</b> {pct:.2f}%"
         )
 
-        self._payload = payload
+        self._results = results
         self.q_list.clear()
         self.details.clear()
 
-        if not payload:
+        if not results:
             self.q_list.addItem(QListWidgetItem("No questions."))
             self.q_list.setEnabled(False)
             self.details.setPlainText("No questions in this round.")
             return
 
         self.q_list.setEnabled(True)
-        for m in payload:
-            is_ok = bool(m.get("correct", False))
-            flagged = bool(m.get("flagged", False))
-            prefix = "★ " if flagged else ""
-            item = QListWidgetItem(f"{prefix}#{m['qnum']}")
-            item.setForeground(Qt.GlobalColor.darkGreen if is_ok else Qt.GlobalColor.red)
-            self.q_list.addItem(item)
+
+        # bulk population: suppress per-item relayout/selection signals and
+        # let Qt repaint once at the end
+        self.q_list.setUpdatesEnabled(False)
+        self.q_list.blockSignals(True)
+        try:
+            for qa, _ua, is_ok, flagged in results:
+                prefix = "★ " if flagged else ""
+                item = QListWidgetItem(f"{prefix}#{qa.qnum}")
+                item.setForeground(Qt.GlobalColor.darkGreen if is_ok else Qt.GlobalColor.red)
+                self.q_list.addItem(item)
+        finally:
+            self.q_list.blockSignals(False)
+            self.q_list.setUpdatesEnabled(True)
 
         self.q_list.setCurrentRow(0)
 
     def _on_selected(self, current, _prev):
-        if not current or not self._payload:
+        if not current or not self._results:
             return
         idx = self.q_list.currentRow()
-        if idx < 0 or idx >= len(self._payload):
+        if idx < 0 or idx >= len(self._results):
             return
 
-        m = self._payload[idx]
-        is_ok = bool(m.get("correct", False))
-        flagged = bool(m.get("flagged", False))
+        qa, ua, is_ok, flagged = self._results[idx]
 
         status = (
             '<span style="color:#0a7a0a; font-weight:600;">CORRECT</span>'
@@ -590,25 +693,55 @@ class ResultsPage(QWidget):
         flag_txt = '<span style="color:#333; font-weight:600;"> — FLAGGED</span>' if flagged else ""
         your_color = "#0a7a0a" if is_ok else "#b00020"
 
-        qnum = escape_html(str(m.get("qnum", "")))
-        qtxt = escape_html(m.get("question_text", "") or "")
-        ua = escape_html(repr(m.get("user_answer", "")))
-        ans = escape_html(m.get("answer_text", "") or "")
-
-        html = f"""
-        <div>
-          <div style="margin-bottom:8px;"><b>Source question #{qnum}</b> — {status}{flag_txt}</div>
-          <pre style="white-space:pre-wrap; font-family:Segoe UI, Consolas, monospace;">{qtxt}</pre>
-          <div style="margin-top:10px;">
-            <b>Your answer:</b> <span style="color:{your_color}; font-weight:600;">{ua}</span>
-          </div>
-          <div style="margin-top:8px;">
-            <b>Answer:</b><br>
-            <span style="color:#0a7a0a; font-weight:600;">{ans}</span>
-          </div>
-        </div>
-        """
-        self.details.setHtml(html)
+        self.details.setHtml(
+            _DETAILS_TPL
+            % {
+                "qnum": escape_html(str(qa.qnum)),
+                "status": status,
+                "flag": flag_txt,
+                "qtxt": escape_html(qa.question_text or ""),
+                "your_color": your_color,
+                "ua": escape_html(repr(ua)),
+                "ans": escape_html(qa.answer_text or ""),
+            }
+        )
+
+
+class _LoaderSignals(QObject):
+    finished = Signal(list)
+    failed = Signal(str)
+
+
+class _QuestionLoader(QRunnable):
+    """Runs load_random_questions on a pool thread so the GUI never blocks
+    on DB open/sampling I/O."""
+
+    def __init__(self, db_path: Path, count: int, seed: Optional[int]):
+        super().__init__()
+        self.signals = _LoaderSignals()
+        self._db_path = db_path
+        self._count = count
+        self._seed = seed
+
+    def run(self):
+        try:
+            qas = load_random_questions(self._db_path, self._count, self._seed)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit(qas)
+
+
+class LoadingPage(QWidget):
+    def __init__(self):
+        super().__init__()
+        layout = QVBoxLayout(self)
+        layout.addStretch(1)
+        label = QLabel("Loading questions…")
+        label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        label.setFont(_BODY_FONT)
+        layout.addWidget(label)
+        layout.addStretch(1)
 
 
 class MainWindow(QMainWindow):
@@ -631,15 +764,23 @@ class MainWindow(QMainWindow):
         self._results: list[tuple[QA, str, bool, bool]] = []
         self._advance_delay_ms = 600
 
+        self._loader: Optional[_QuestionLoader] = None
+
         self.start_page = StartPage(self.start_round, self.pick_db)
+        self.loading_page = LoadingPage()
         self.quiz_page = QuizPage(self.submit_current, self.quit_round)
         self.results_page = ResultsPage(self.back_to_start)
 
         self.stack.addWidget(self.start_page)
+        self.stack.addWidget(self.loading_page)
         self.stack.addWidget(self.quiz_page)
         self.stack.addWidget(self.results_page)
 
     def pick_db(self) -> Optional[Path]:
+        # deferred import: the file dialog binding is only paid for if the
+        # user actually browses for a database, keeping cold start lighter
+        from PySide6.QtWidgets import QFileDialog
+
         path, _ = QFileDialog.getOpenFileName(
             self,
             "Select cnab_questions.db",
@@ -661,12 +802,6 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Database", f"DB not found:\n{db_path}")
             return
 
-        try:
-            self._qas = load_random_questions(db_path, count, seed)
-        except Exception as e:
-            QMessageBox.critical(self, "Load Questions Failed", str(e))
-            return
-
         self._idx = 0
         self._seed = seed
         self._case_sensitive = case_sensitive
@@ -674,12 +809,42 @@ class MainWindow(QMainWindow):
         self._shuffle_options = shuffle_options
         self._results = []
 
-        self.quiz_page.set_round_config(shuffle_options=shuffle_options, seed=seed)
+        # Load off the GUI thread; cold DB opens can visibly stall the window.
+        loader = _QuestionLoader(db_path, count, seed)
+        loader.signals.finished.connect(self._on_questions_loaded)
+        loader.signals.failed.connect(self._on_load_failed)
+        self._loader = loader  # keep the signal holder alive until delivery
+
+        self.stack.setCurrentWidget(self.loading_page)
+        QThreadPool.globalInstance().start(loader)
+
+    def _on_questions_loaded(self, qas: list):
+        self._loader = None
+        self._qas = qas
+
+        # fix each question's option display order once, up front; one seeded
+        # generator covers the round since the question order is itself
+        # seed-determined
+        display_options = None
+        if self._shuffle_options:
+            rng = random.Random(self._seed)
+            display_options = {}
+            for qa in qas:
+                opts = list(qa.mc_options)
+                rng.shuffle(opts)
+                display_options[qa.qnum] = opts
+
+        self.quiz_page.set_round_config(display_options=display_options)
 
         self.stack.setCurrentWidget(self.quiz_page)
         self.quiz_page.reset_round()
         self._show_question()
 
+    def _on_load_failed(self, message: str):
+        self._loader = None
+        self.stack.setCurrentWidget(self.start_page)
+        QMessageBox.critical(self, "Load Questions Failed", message)
+
     def _show_question(self):
         qa = self._qas[self._idx]
         self.quiz_page.set_question(self._idx + 1, len(self._qas), qa)
@@ -707,29 +872,23 @@ class MainWindow(QMainWindow):
             QTimer.singleShot(self._advance_delay_ms, self.finish_round)
             return
 
-        def _advance():
-            self._idx += 1
-            self._show_question()
+        # warm the next question's option cache during the feedback pause so
+        # the advance callback only does widget work, not parsing
+        _ = self._qas[self._idx + 1].mc_options
 
-        QTimer.singleShot(self._advance_delay_ms, _advance)
+        QTimer.singleShot(self._advance_delay_ms, self._advance_to_next)
+
+    def _advance_to_next(self):
+        self._idx += 1
+        self._show_question()
 
     def finish_round(self):
         correct_count = sum(1 for _, _, c, _ in self._results if c)
         total = len(self._results)
 
-        review = [
-            {
-                "qnum": qa.qnum,
-                "question_text": qa.question_text,
-                "user_answer": ua,
-                "answer_text": qa.answer_text,
-                "correct": c,
-                "flagged": flagged,
-            }
-            for qa, ua, c, flagged in self._results
-        ]
-
-        self.results_page.set_results(correct_count, total, review)
+        # hand the result tuples over as-is; the results page renders details
+        # for the selected row only, so no per-question dicts are built
+        self.results_page.set_results(correct_count, total, self._results)
         self.stack.setCurrentWidget(self.results_page)
 
     def quit_round(self):
@@ -5,15 +5,39 @@ Important: This module does not modify stored question/answer verbiage.
 
 from __future__ import annotations
 
+import json
+import queue
 import random
 import re
 import sqlite3
-from dataclasses import dataclass
+import string
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 
-@dataclass
+# compiled once at import; sits on the render hot path. Multiline so one
+# C-level scan covers the whole question text; [ \t] instead of \s keeps
+# the per-line anchoring intact (\s would match the newlines themselves).
+# dashes spelled out as escapes (hyphen-minus, en-dash, em-dash) so the
+# pattern survives any editor re-encoding
+_MC_RE = re.compile(r"(?m)^[ \t]*([A-Z])[ \t]*[-\u2013\u2014][ \t]*(.+?)[ \t]*$")
+
+# constant SQL text (no per-round IN-list), so sqlite3's per-connection
+# statement cache can reuse the prepared plans across rounds
+_STATS_SQL = "SELECT COUNT(*), MAX(qnum) FROM questions"
+_QNUMS_SQL = "SELECT qnum FROM questions"
+# json_each preserves array order via j.rowid, so the rows come back already
+# in the sampled order and a single JSON string binds any number of qnums
+_ROUND_SQL = """
+    SELECT q.qnum, q.question_text, q.answer_text, q.answer_value, q.answer_option
+    FROM json_each(?) j JOIN questions q ON q.qnum = j.value
+    ORDER BY j.rowid
+"""
+
+
+@dataclass(slots=True)
 class QA:
     qnum: int
     question_text: str
@@ -21,55 +45,252 @@ class QA:
     answer_value: Optional[str]
     answer_option: Optional[str]
 
+    # lazy caches; stored answers are immutable per round, so normalize once
+    _norm_value: Optional[str] = field(default=None, init=False, repr=False)
+    _norm_text: Optional[str] = field(default=None, init=False, repr=False)
+    _answer_tokens: Optional[frozenset[str]] = field(default=None, init=False, repr=False)
+    _mc_options: Optional[list[tuple[str, str]]] = field(default=None, init=False, repr=False)
+    _opt_upper: Optional[str] = field(default=None, init=False, repr=False)
+    _value_stripped: Optional[str] = field(default=None, init=False, repr=False)
+    _value_parts_ci: Optional[frozenset[str]] = field(default=None, init=False, repr=False)
+
+    @property
+    def norm_answer_value(self) -> Optional[str]:
+        if self._norm_value is None and self.answer_value is not None:
+            self._norm_value = normalize(self.answer_value)
+        return self._norm_value
+
+    @property
+    def norm_answer_text(self) -> str:
+        if self._norm_text is None:
+            self._norm_text = normalize(self.answer_text)
+        return self._norm_text
+
+    @property
+    def answer_tokens(self) -> frozenset[str]:
+        if self._answer_tokens is None:
+            self._answer_tokens = frozenset(self.norm_answer_text.split())
+        return self._answer_tokens
+
+    @property
+    def answer_option_upper(self) -> Optional[str]:
+        if self._opt_upper is None and self.answer_option is not None:
+            self._opt_upper = self.answer_option.strip().upper()
+        return self._opt_upper
+
+    @property
+    def answer_value_stripped(self) -> Optional[str]:
+        if self._value_stripped is None and self.answer_value is not None:
+            self._value_stripped = self.answer_value.strip()
+        return self._value_stripped
+
+    @property
+    def value_parts_ci(self) -> Optional[frozenset[str]]:
+        if self._value_parts_ci is None and self.answer_value is not None:
+            self._value_parts_ci = frozenset(
+                normalize(p) for p in _iter_csv(self.answer_value)
+            )
+        return self._value_parts_ci
+
+    @property
+    def mc_options(self) -> list[tuple[str, str]]:
+        if self._mc_options is None:
+            self._mc_options = extract_mc_options(self.question_text)
+        return self._mc_options
+
 
 def normalize(s: str) -> str:
-    # grading normalization only; does not modify stored data
-    return re.sub(r"\s+", " ", (s or "").strip()).lower()
+    # grading normalization only; does not modify stored data.
+    # str.split() collapses whitespace runs and trims the ends in one C pass,
+    # so no regex is needed; casefold() handles non-ASCII case pairs too.
+    return " ".join((s or "").casefold().split())
+
+
+def _iter_csv(s: Optional[str]):
+    # lazily yield stripped, non-empty comma-separated tokens; callers feed
+    # the stream straight into set()/frozenset() with no intermediate list
+    return (p for p in (t.strip() for t in (s or "").split(",")) if p)
+
+
+_WORD = frozenset(string.ascii_letters + string.digits + "_")
+
+
+def _wb_contains(hay: str, needle: str) -> bool:
+    """True if `needle` occurs in `hay` flanked by non-word characters.
+
+    Does what re.search(rf"\\b{re.escape(needle)}\\b", hay) did for these
+    inputs, but as a plain str.find scan: no pattern build, no regex
+    dispatch, and str.find runs a C substring search. The boundary class
+    is ASCII, which is all normalize() leaves around these answers.
+    """
+    n = len(needle)
+    end = len(hay) - n
+    i = 0
+    while True:
+        j = hay.find(needle, i)
+        if j < 0:
+            return False
+        if (j == 0 or hay[j - 1] not in _WORD) and (j == end or hay[j + n] not in _WORD):
+            return True
+        i = j + 1
+
+
+def _connect(db_path: Path) -> sqlite3.Connection:
+    """Open the question DB read-only with a read-tuned page cache.
+
+    Read-only intent is declared via the URI rather than PRAGMA query_only,
+    because query_only would also block the session temp table used for
+    sampling (temp storage counts as a writable database).
+    """
+    conn = sqlite3.connect(
+        f"file:{Path(db_path).resolve().as_posix()}?mode=ro",
+        uri=True,
+        # pooled connections may be created on the GUI's loader thread and
+        # reused from the main thread; read-only use makes that safe
+        check_same_thread=False,
+    )
+    conn.execute("PRAGMA cache_size=-65536")    # 64 MiB page cache
+    conn.execute("PRAGMA mmap_size=268435456")  # 256 MiB mmap window
+    conn.execute("PRAGMA temp_store=MEMORY")    # keep sort/temp space off disk
+    # expose grading normalization to SQL so bulk searches stay inside SQLite
+    conn.create_function("norm", 1, normalize, deterministic=True)
+    return conn
+
 
+# small LIFO pool per database path: opening a connection pays VFS, schema
+# and pragma setup on every call, and LIFO reuse keeps the most recently
+# used connection's page cache warm
+_POOL: dict[str, queue.LifoQueue] = {}
+_POOL_CAP = 4
 
-def _split_csv_list(s: str) -> list[str]:
-    return [p.strip() for p in (s or "").split(",") if p.strip()]
+
+@contextmanager
+def get_conn(db_path: Path) -> Iterator[sqlite3.Connection]:
+    """Check a pooled read-only connection out for the duration of a block."""
+    key = str(Path(db_path).resolve())
+    pool = _POOL.setdefault(key, queue.LifoQueue(maxsize=_POOL_CAP))
+    try:
+        conn = pool.get_nowait()
+    except queue.Empty:
+        conn = _connect(db_path)
+    try:
+        yield conn
+    finally:
+        try:
+            pool.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+
+def search_answers(db_path: Path, text: str) -> list[int]:
+    """Return qnums whose stored answer text contains `text`, using the same
+    normalization as grading. The scan runs inside SQLite via the norm() UDF
+    and C-level instr() rather than row-at-a-time Python."""
+    needle = normalize(text)
+    if not needle:
+        return []
+
+    with get_conn(db_path) as conn:
+        return [
+            r[0]
+            for r in conn.execute(
+                "SELECT qnum FROM questions WHERE instr(norm(answer_text), ?) > 0",
+                (needle,),
+            )
+        ]
 
 
 def load_random_questions(db_path: Path, count: int, seed: Optional[int]) -> list[QA]:
     rng = random.Random(seed)
 
-    with sqlite3.connect(str(db_path)) as conn:
-        conn.row_factory = sqlite3.Row
-        total = conn.execute("SELECT COUNT(*) AS c FROM questions").fetchone()["c"]
+    with get_conn(db_path) as conn:
+        # sample qnums to avoid expensive ORDER BY RANDOM() for larger dbs
+        total, max_qnum = conn.execute(_STATS_SQL).fetchone()
         if total == 0:
             raise ValueError("Database contains 0 questions.")
 
         if count > total:
             raise ValueError(f"Requested {count} questions, but database only has {total}.")
 
-        # sample qnums to avoid expensive ORDER BY RANDOM() for larger dbs
-        qnums = [r["qnum"] for r in conn.execute("SELECT qnum FROM questions").fetchall()]
-        chosen = rng.sample(qnums, count)
-
-        rows = conn.execute(
-            f"""
-            SELECT qnum, question_text, answer_text, answer_value, answer_option
-            FROM questions
-            WHERE qnum IN ({",".join("?" for _ in chosen)})
+        if max_qnum == total:
+            # qnums are dense 1..N (the usual build_db result): sample the
+            # range directly instead of materializing every qnum over SQLite
+            chosen = rng.sample(range(1, total + 1), count)
+        else:
+            chosen = rng.sample([r[0] for r in conn.execute(_QNUMS_SQL)], count)
+
+        # one round trip: the sampled qnums travel as a single JSON parameter
+        # (constant SQL text, so the cached prepared statement is reused) and
+        # SQLite returns the rows in sampled order -- no Python-side reorder
+        return [QA(*row) for row in conn.execute(_ROUND_SQL, (json.dumps(chosen),))]
+
+
+def grade_round(
+    db_path: Path, answers: list[tuple[int, str]], case_sensitive: bool = False
+) -> list[bool]:
+    """Grade a whole round of (qnum, user_answer) pairs in one SQL pass.
+
+    The option-letter and exact answer-value comparisons run inside SQLite
+    for the entire batch; only answers those branches reject (and that have
+    no stored option letter) are re-checked with is_correct, so results
+    match per-question grading while skipping N Python calls for the
+    common exact-match case.
+    """
+    if not answers:
+        return []
+
+    with get_conn(db_path) as conn:
+        conn.execute(
+            "CREATE TEMP TABLE IF NOT EXISTS _ua (pos INTEGER PRIMARY KEY, qnum INTEGER, ans TEXT)"
+        )
+        conn.execute("DELETE FROM _ua")
+        conn.executemany(
+            "INSERT INTO _ua (pos, qnum, ans) VALUES (?, ?, ?)",
+            [(i, qnum, ua) for i, (qnum, ua) in enumerate(answers)],
+        )
+
+        results = [False] * len(answers)
+        for pos, ok, *row in conn.execute(
+            """
+            SELECT u.pos,
+                   CASE
+                       WHEN q.answer_option IS NOT NULL
+                           THEN upper(trim(u.ans)) = upper(trim(q.answer_option))
+                       WHEN q.answer_value IS NULL THEN 0
+                       WHEN ? THEN trim(u.ans) = trim(q.answer_value)
+                       ELSE lower(trim(u.ans)) = lower(trim(q.answer_value))
+                   END,
+                   q.qnum, q.question_text, q.answer_text, q.answer_value, q.answer_option
+            FROM _ua u JOIN questions q ON q.qnum = u.qnum
+            ORDER BY u.pos
             """,
-            chosen,
-        ).fetchall()
+            (1 if case_sensitive else 0,),
+        ):
+            if ok:
+                results[pos] = True
+            elif row[4] is None:
+                # no stored option letter: apply the lenient CSV/fallback rules
+                results[pos] = is_correct(answers[pos][1], QA(*row), case_sensitive)
 
-        # preserve randomized order
-        by_qnum = {r["qnum"]: r for r in rows}
-        ordered = [by_qnum[n] for n in chosen]
+        return results
 
-        return [
-            QA(
-                qnum=r["qnum"],
-                question_text=r["question_text"],
-                answer_text=r["answer_text"],
-                answer_value=r["answer_value"],
-                answer_option=r["answer_option"],
-            )
-            for r in ordered
-        ]
+
+def grade_batch(
+    user_answers: list[str], qas: list[QA], case_sensitive: bool = False
+) -> list[bool]:
+    """Grade parallel lists of user answers and already-loaded QAs.
+
+    Batch re-grades (review screens, practice-mode re-checks) should not
+    pay a DB round trip per call the way grade_round does; this runs the
+    comparison loop over the in-memory QAs. The per-QA normalized fields
+    are cached on the instances, so a second pass over the same round does
+    no repeated normalization work.
+    """
+    if len(user_answers) != len(qas):
+        raise ValueError(f"Got {len(user_answers)} answers for {len(qas)} questions.")
+
+    check = is_correct  # local binding keeps the loop free of global lookups
+    return [check(ua, qa, case_sensitive) for ua, qa in zip(user_answers, qas)]
 
 
 def extract_mc_options(question_text: str) -> list[tuple[str, str]]:
@@ -79,12 +300,9 @@ def extract_mc_options(question_text: str) -> list[tuple[str, str]]:
       C - DHCP
     Returns: [("A","BOOTP"), ...]
     """
-    opts: list[tuple[str, str]] = []
-    for line in (question_text or "").splitlines():
-        m = re.match(r"^\s*([A-Z])\s*[-–]\s*(.+?)\s*$", line)
-        if m:
-            opts.append((m.group(1).upper(), m.group(2)))
-    return opts
+    # one multiline findall over the whole text: no splitlines() list, no
+    # per-line interpreter loop (which also retires the old line prefilter)
+    return [(a.upper(), b) for a, b in _MC_RE.findall(question_text or "")]
 
 
 def is_correct(user_answer: str, qa: QA, case_sensitive: bool) -> bool:
@@ -94,7 +312,7 @@ def is_correct(user_answer: str, qa: QA, case_sensitive: bool) -> bool:
 
     # 1) Multiple-choice with stored answer option: grade by option letter only
     if qa.answer_option:
-        if ua.upper() == qa.answer_option.strip().upper():
+        if ua.upper() == qa.answer_option_upper:
             return True
 
         # If user answered a single letter (A/B/C/D) and it's wrong, it's wrong.
@@ -107,27 +325,27 @@ def is_correct(user_answer: str, qa: QA, case_sensitive: bool) -> bool:
     # 2) Fill-in / text-based: grade against derived answer_value (preferred)
     if qa.answer_value:
         # (10) Order-insensitive multi-answer grading for comma-separated values,
-        # unless the question explicitly requires ordering (alphabetical / reverse alphabetical).
-        qlow = (qa.question_text or "").lower()
-        order_required = ("alphabetical order" in qlow) or ("reverse alphabetical" in qlow)
-
-        if (not order_required) and ("," in qa.answer_value) and ("," in ua):
-            exp_parts = _split_csv_list(qa.answer_value)
-            user_parts = _split_csv_list(ua)
-
-            if case_sensitive:
-                if set(user_parts) == set(exp_parts):
-                    return True
-            else:
-                if set(normalize(x) for x in user_parts) == set(normalize(x) for x in exp_parts):
-                    return True
+        # unless the question explicitly requires ordering (alphabetical / reverse
+        # alphabetical). The comma probes gate the branch so the question-text
+        # lowering only happens when both sides actually look like lists.
+        if "," in qa.answer_value and "," in ua:
+            qlow = (qa.question_text or "").lower()
+            if "alphabetical order" not in qlow and "reverse alphabetical" not in qlow:
+                if case_sensitive:
+                    if set(_iter_csv(ua)) == set(_iter_csv(qa.answer_value)):
+                        return True
+                else:
+                    # compare against the QA's cached frozenset; the expected side
+                    # is re-split/renormalized at most once per question
+                    if frozenset(normalize(x) for x in _iter_csv(ua)) == qa.value_parts_ci:
+                        return True
 
         # Default: exact match (with optional normalization)
         if case_sensitive:
-            if ua == qa.answer_value.strip():
+            if ua == qa.answer_value_stripped:
                 return True
         else:
-            if normalize(ua) == normalize(qa.answer_value):
+            if normalize(ua) == qa.norm_answer_value:
                 return True
 
     # 3) Fallback: whole-word/phrase match in answer_text; avoid 1-2 char traps
@@ -135,10 +353,16 @@ def is_correct(user_answer: str, qa: QA, case_sensitive: bool) -> bool:
     if case_sensitive:
         if len(ua) < 3:
             return False
-        return re.search(rf"\b{re.escape(ua)}\b", at) is not None
+        return _wb_contains(at, ua)
 
     ua_n = normalize(ua)
-    at_n = normalize(at)
+    at_n = qa.norm_answer_text
     if len(ua_n) < 3:
         return False
-    return re.search(rf"\b{re.escape(ua_n)}\b", at_n) is not None
+
+    # For long answers, an O(1) token-set hit beats scanning the whole text;
+    # a miss still falls through since tokens split on whitespace, not punctuation.
+    if len(at_n) > 256 and ua_n in qa.answer_tokens:
+        return True
+
+    return _wb_contains(at_n, ua_n)